@@ -0,0 +1,139 @@
+"""
+Bell synthesis shared by generate_bells.py and the sound_explore.py notebook.
+Requires: numpy
+
+Install with: pip install numpy
+"""
+
+import functools
+import math
+import struct
+import numpy as np
+
+# Bell partials as (multiple of fundamental, relative amplitude): fundamental,
+# octave, perfect fifth above octave, two inharmonic overtones
+DEFAULT_HARMONICS = ((1.0, 1.0), (2.0, 0.5), (3.0, 0.3), (4.5, 0.2), (5.4, 0.15))
+
+def exp_sequence(rates, n_samples):
+    """
+    Compute exp(rate * n) for n = 0..n_samples-1 by repeated doubling.
+
+    Each pass multiplies the samples filled so far by exp(rate * filled),
+    so only log2(n_samples) complex exponentials are evaluated per rate
+    instead of one per sample, and rounding error grows only with the
+    number of passes.
+
+    Args:
+        rates: 1-D array of complex rates per sample (one per harmonic)
+        n_samples: Number of samples to generate
+
+    Returns:
+        complex64 array of shape (len(rates), n_samples)
+    """
+    rates = np.asarray(rates, dtype=np.complex128)
+    out = np.empty((len(rates), n_samples), dtype=np.complex64)
+    out[:, 0] = 1.0
+    filled = 1
+    while filled < n_samples:
+        count = min(filled, n_samples - filled)
+        step = np.exp(rates * filled).astype(np.complex64)
+        np.multiply(out[:, :count], step[:, None], out=out[:, filled:filled + count])
+        filled += count
+    return out
+
+@functools.lru_cache(maxsize=32)
+def generate_bell_tone(duration_sec, frequency, sample_rate=44100, harmonics=DEFAULT_HARMONICS):
+    """
+    Generate a bell-like tone with harmonic overtones and decay.
+
+    Args:
+        duration_sec: Duration in seconds
+        frequency: Fundamental frequency in Hz
+        sample_rate: Audio sample rate (default: 44100 Hz)
+        harmonics: Tuple of (multiple of fundamental, relative amplitude)
+            pairs (default: DEFAULT_HARMONICS)
+
+    Returns:
+        Read-only numpy array of audio samples, cached per arguments
+    """
+    # Number of samples (float32 throughout: the output is 16-bit PCM anyway)
+    n_samples = int(sample_rate * duration_sec)
+
+    # Fundamental plus harmonics (overtones) for bell-like quality
+    mults = np.array([mult for mult, _ in harmonics])
+    amps = np.array([amp for _, amp in harmonics], dtype=np.float32)
+
+    # Harmonics are the imaginary parts of exp((i*omega - alpha) * n): omega
+    # in radians per sample, and alpha the exponential bell-like decay per
+    # sample, so sines and decay come from one recurrence instead of
+    # np.sin and np.exp over every sample
+    omegas = 2 * np.pi * frequency * mults / sample_rate
+    alpha = 3.0 / (sample_rate * duration_sec)
+    phasors = exp_sequence(1j * omegas - alpha, n_samples)
+
+    # Weight the contiguous complex phasors and take the imaginary part of
+    # the sum, rather than reducing over the strided phasors.imag view; copy
+    # it out so the remaining passes run on a contiguous float32 array
+    signal = np.ascontiguousarray((amps @ phasors).imag)
+
+    # Add slight attack (fade in) to avoid clicks
+    attack_samples = int(0.01 * sample_rate)  # 10ms attack
+    signal[:attack_samples] *= np.linspace(0, 1, attack_samples, dtype=np.float32)
+
+    # Normalize to prevent clipping. Since |signal[n]| <= sum(amps) * exp(-alpha * n),
+    # nothing past the sample where that bound falls below the peak of the
+    # first cycles can be louder, so only the head of the bell is scanned
+    # (the phasors are consumed, so their buffer holds the abs() values)
+    scratch = phasors.reshape(-1).view(np.float32)
+    head = min(n_samples, attack_samples + int(sample_rate / frequency))
+    peak = np.abs(signal[:head], out=scratch[:head]).max()
+    end = min(n_samples, int(math.log(amps.sum() / peak) / alpha) + 1)
+    if end > head:
+        peak = max(peak, np.abs(signal[head:end], out=scratch[:end - head]).max())
+    np.multiply(signal, np.float32(0.8) / peak, out=signal)
+
+    # Cached result is shared between callers, so don't let them mutate it
+    signal.setflags(write=False)
+    return signal
+
+def wav_header(n_samples, sample_rate, bits=16, channels=1):
+    """
+    Build the 44-byte RIFF/WAVE header for uncompressed PCM data.
+
+    Args:
+        n_samples: Number of samples per channel
+        sample_rate: Sample rate in Hz
+        bits: Bits per sample (default: 16)
+        channels: Number of channels (default: 1)
+
+    Returns:
+        Header bytes, to be followed by the raw little-endian samples
+    """
+    block_align = channels * bits // 8
+    data_size = n_samples * block_align
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, bits,
+        b"data", data_size,
+    )
+
+def save_bell_sound(filename, signal, sample_rate=44100):
+    """
+    Save audio signal as WAV file.
+
+    Args:
+        filename: Output filename
+        signal: Audio signal (numpy array)
+        sample_rate: Sample rate in Hz
+    """
+    # Convert to 16-bit PCM, scaling straight into the int16 buffer
+    # instead of through a full-size float temporary
+    audio_int16 = np.empty(signal.shape, dtype="<i2")
+    np.multiply(signal, 32767, out=audio_int16, casting="unsafe")
+
+    # Mono 16-bit PCM is a fixed header plus the raw samples
+    with open(filename, "wb") as f:
+        f.write(wav_header(len(audio_int16), sample_rate))
+        audio_int16.tofile(f)
+    print(f"✓ Generated: {filename}")